@@ -15,19 +15,25 @@ wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v
 uv run examples/app.py
 """
 
+import functools
+
 import gradio as gr
 import numpy as np
 
 from kokoro_onnx import Kokoro
-from kokoro_onnx.tokenizer import Tokenizer
 
-tokenizer = Tokenizer()
+# Create the session once and reuse its tokenizer for phonemes preview
 kokoro = Kokoro("kokoro-v1.0.onnx", "voices-v1.0.bin")
+tokenizer = kokoro.tokenizer
+# Sorted voice names, listed once for the dropdowns
+voices = kokoro.get_voices()
 
 
 SUPPORTED_LANGUAGES = ["en-us"]
 
 
+# Same inputs always give the same audio, reuse it instead of running the model again
+@functools.lru_cache(maxsize=64)
 def create(text: str, voice: str, language: str, blend_voice_name: str = None):
     phonemes = tokenizer.phonemize(text, lang=language)
 
@@ -54,13 +60,11 @@ def create_app():
             value="en-us",
             choices=SUPPORTED_LANGUAGES,
         )
-        voice_input = gr.Dropdown(
-            label="Voice", value="af_sky", choices=sorted(kokoro.get_voices())
-        )
+        voice_input = gr.Dropdown(label="Voice", value="af_sky", choices=voices)
         blend_voice_input = gr.Dropdown(
             label="Blend Voice (Optional)",
             value=None,
-            choices=sorted(kokoro.get_voices()) + [None],
+            choices=[*voices, None],
         )
         submit_button = gr.Button("Create")
         phonemes_output = gr.Textbox(label="Phonemes")
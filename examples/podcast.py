@@ -6,12 +6,10 @@ wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v
 python examples/podcast.py
 """
 
-import random
-
 import numpy as np
 import soundfile as sf
 
-from kokoro_onnx import Kokoro
+from kokoro_onnx import SAMPLE_RATE, Kokoro
 
 # fmt: off
 sentences = [
@@ -25,15 +23,15 @@ sentences = [
     { "voice": "am_michael", "text": "It’s going to be a good one!" }   # Michael
 ]
 
-def random_pause(min_duration=0.5, max_duration=2.0):
-    silence_duration = random.uniform(min_duration, max_duration)
-    silence = np.zeros(int(silence_duration * sample_rate))
-    return silence
+def random_pauses(count, min_duration=0.5, max_duration=2.0):
+    # Draw all pause lengths (in samples) at once
+    durations = np.random.uniform(min_duration, max_duration, count)
+    return (durations * SAMPLE_RATE).astype(int)
 
 
 kokoro = Kokoro("kokoro-v1.0.onnx", "voices-v1.0.bin")
 
-audio = []
+parts = []
 
 for sentence in sentences:
     voice = sentence["voice"]
@@ -46,13 +44,18 @@ for sentence in sentences:
         speed=1.0,
         lang="en-us",
     )
-    audio.append(samples)
-    # Add random silence after each sentence
-    audio.append(random_pause())
+    parts.append(samples)
+
+# Add random silence after each sentence
+pauses = random_pauses(len(parts))
 
-# Concatenate all audio parts
-audio = np.concatenate(audio)
+# Allocate the podcast once and copy each part in place, pauses are already silent
+audio = np.zeros(sum(len(part) for part in parts) + pauses.sum(), dtype=np.float32)
+offset = 0
+for part, pause in zip(parts, pauses):
+    audio[offset : offset + len(part)] = part
+    offset += len(part) + pause
 
 # Save the generated audio to file
-sf.write("podcast.wav", audio, sample_rate)
+sf.write("podcast.wav", audio, SAMPLE_RATE)
 print("Created podcast.wav")
@@ -13,6 +13,9 @@ Setup:
 Run:
 macOS/Linux: ONNX_PROVIDER="CPUExecutionProvider" python examples/with_provider.py
 Windows PowerShell: $env:ONNX_PROVIDER="CPUExecutionProvider" ; python examples/with_provider.py
+
+Fallback chain (first available provider is used):
+ONNX_PROVIDER="CUDAExecutionProvider,CPUExecutionProvider" python examples/with_provider.py
 """
 
 import soundfile as sf
@@ -8,9 +8,11 @@ Usage:
    pip install -U kokoro-onnx sounddevice
 2. Download a model (choose one):
    - INT8 (88MB):
-     wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files/kokoro-v0_19.int8.onnx
+     wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.int8.onnx
    - FP16 (169MB):
-     wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files/kokoro-v0_19.fp16.onnx
+     wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.fp16.onnx
+   - Or quantize the FP32 model yourself (see scripts/quantize.py):
+     uv run scripts/quantize.py --input kokoro-v1.0.onnx --output kokoro-v1.0.int8.onnx
 3. Download voices-v1.0.bin:
    wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/voices-v1.0.bin
 4. Run example:
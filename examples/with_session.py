@@ -4,6 +4,8 @@ pip install -U kokoro-onnx soundfile
 wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.onnx
 wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/voices-v1.0.bin
 python examples/with_session.py
+
+Note: to only change the threads count you can set ONNX_INTRA_OP_NUM_THREADS environment variable with Kokoro(...)
 """
 
 import os
@@ -14,6 +16,10 @@ from onnxruntime import InferenceSession
 
 from kokoro_onnx import Kokoro
 
+MODEL_PATH = "kokoro-v1.0.onnx"
+# Graph optimized model, saved on first run. It's specific to the machine and providers it was created with
+OPTIMIZED_MODEL_PATH = "kokoro-v1.0.opt.onnx"
+
 
 def create_session():
     # See list of providers https://github.com/microsoft/onnxruntime/issues/22101#issuecomment-2357667377
@@ -26,8 +32,24 @@ def create_session():
     cpu_count = os.cpu_count()
     print(f"Setting threads to CPU cores count: {cpu_count}")
     sess_options.intra_op_num_threads = cpu_count
+
+    # See https://onnxruntime.ai/docs/performance/model-optimizations/graph-optimizations.html#onlineoffline-mode
+    if os.path.exists(OPTIMIZED_MODEL_PATH):
+        # Optimizations already applied, skip them on startup
+        print(f"Loading optimized model from {OPTIMIZED_MODEL_PATH}")
+        model_path = OPTIMIZED_MODEL_PATH
+        sess_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        )
+    else:
+        print(f"Saving optimized model to {OPTIMIZED_MODEL_PATH}")
+        model_path = MODEL_PATH
+        sess_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        sess_options.optimized_model_filepath = OPTIMIZED_MODEL_PATH
     session = InferenceSession(
-        "kokoro-v1.0.onnx", providers=providers, sess_options=sess_options
+        model_path, providers=providers, sess_options=sess_options
     )
     return session
 
@@ -12,7 +12,7 @@ import asyncio
 
 import sounddevice as sd
 
-from kokoro_onnx import Kokoro
+from kokoro_onnx import SAMPLE_RATE, Kokoro
 
 text = """
 We've just been hearing from Matthew Cappucci, a senior meteorologist at the weather app MyRadar, who says Kansas City is seeing its heaviest snow in 32 years - with more than a foot (30 to 40cm) having come down so far.
@@ -37,12 +37,15 @@ async def main():
         lang="en-us",
     )
 
-    count = 0
-    async for samples, sample_rate in stream:
-        count += 1
-        print(f"Playing audio stream ({count})...")
-        sd.play(samples, sample_rate)
-        sd.wait()
+    # Keep one output stream open and write chunks as they arrive, so there is no gap between them
+    loop = asyncio.get_running_loop()
+    with sd.OutputStream(samplerate=SAMPLE_RATE, channels=1, dtype="float32") as out:
+        count = 0
+        async for samples, sample_rate in stream:
+            count += 1
+            print(f"Playing audio stream ({count})...")
+            # Write in a thread so the next chunk keeps generating meanwhile
+            await loop.run_in_executor(None, out.write, samples)
 
 
 asyncio.run(main())
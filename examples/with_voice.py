@@ -6,6 +6,8 @@ wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v
 python examples/with_voice.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import soundfile as sf
 
@@ -13,14 +15,23 @@ from kokoro_onnx import Kokoro
 from kokoro_onnx.config import SAMPLE_RATE
 
 kokoro = Kokoro("kokoro-v1.0.onnx", "voices-v1.0.bin")
-created = []
 
-for voice in kokoro.get_voices():
-    samples, sample_rate = kokoro.create(
+
+def create(voice: str):
+    samples, _ = kokoro.create(
         f"Hello! This audio generated by {voice}!", voice=voice, speed=1.0
     )
-    created.append(samples)
     print(f"Generated audio for {voice}")
+    return samples
+
+
+# onnxruntime releases the GIL while running, so a couple of voices can be created concurrently.
+# Each run already uses all cores through onnxruntime's own thread pool, so more workers
+# mostly oversubscribe the CPU and multiply peak memory; the gain is overlapping the
+# phonemization and trimming of one voice with inference of another.
+# map() keeps the results in the order of voices
+with ThreadPoolExecutor(max_workers=2) as executor:
+    created = list(executor.map(create, kokoro.get_voices()))
 
 audio = np.concatenate(created)
 
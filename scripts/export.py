@@ -17,6 +17,7 @@ wget https://huggingface.co/hexgrad/Kokoro-82M-v1.1-zh/resolve/main/config.json
 wget https://huggingface.co/hexgrad/Kokoro-82M-v1.1-zh/resolve/main/kokoro-v1_1-zh.pth -O checkpoints/kokoro-v1_1-zh.pth
 uv run examples/export.py
 uv run examples/export.py --config_file checkpoints/config.json --checkpoint_path checkpoints/kokoro-v1_1-zh.pth
+uv run examples/export.py --external_data
 """
 
 import argparse
@@ -29,8 +30,10 @@ import torch
 from kokoro import KModel, KPipeline
 from kokoro.model import KModelForONNX
 
+WEIGHTS_FILE = "kokoro.weights"
 
-def export_onnx(model, output):
+
+def export_onnx(model, output, external_data=False):
     onnx_file = output + "/" + "kokoro.onnx"
 
     input_ids = torch.randint(1, 100, (48,)).numpy()
@@ -60,6 +63,23 @@ def export_onnx(model, output):
     onnx.checker.check_model(onnx_model)
     print("onnx check ok!")
 
+    if external_data:
+        # onnx appends to an existing weights file, remove it so re-exports don't grow it
+        weights_file = os.path.join(output, WEIGHTS_FILE)
+        if os.path.exists(weights_file):
+            os.remove(weights_file)
+
+        # Keep weights in a separate file which onnxruntime can map instead of copying into the process heap
+        onnx.save_model(
+            onnx_model,
+            onnx_file,
+            save_as_external_data=True,
+            all_tensors_to_one_file=True,
+            location=WEIGHTS_FILE,
+            size_threshold=1024,
+        )
+        print(f"saved weights to {WEIGHTS_FILE} ok!")
+
 
 def load_input_ids(pipeline, text):
     if pipeline.lang_code in "ab":
@@ -169,6 +189,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output_dir", "-o", type=str, default="onnx", help="output directory"
     )
+    parser.add_argument(
+        "--external_data",
+        "-e",
+        help=f"save weights to external data file ({WEIGHTS_FILE})",
+        action="store_true",
+    )
 
     args = parser.parse_args()
 
@@ -188,4 +214,4 @@ if __name__ == "__main__":
     elif args.check:
         check_model(model)
     else:
-        export_onnx(model, output_dir)
+        export_onnx(model, output_dir, args.external_data)
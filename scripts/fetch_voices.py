@@ -17,12 +17,15 @@ https://huggingface.co/hexgrad/Kokoro-82M/blob/main/VOICES.md
 
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import requests
 import torch
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 config = {
     "Kokoro-82M-v1.1-zh": {
@@ -36,11 +39,29 @@ config = {
     #     "npz_path": "voices-v1.0.bin",
     # },
 }
-# Extract voice names
+
+TIMEOUT = 60
+MAX_WORKERS = 8
+
+
+def create_session() -> requests.Session:
+    # Reuse connections across downloads and retry on flaky networks
+    session = requests.Session()
+    retries = Retry(
+        total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]
+    )
+    session.mount(
+        "https://", HTTPAdapter(max_retries=retries, pool_maxsize=MAX_WORKERS)
+    )
+    return session
 
 
+session = create_session()
+
+
+# Extract voice names
 def get_voice_names(api_url):
-    resp = requests.get(api_url)
+    resp = session.get(api_url, timeout=TIMEOUT)
     resp.raise_for_status()
     data = resp.json()
     names = [voice["path"][7:-3] for voice in data]
@@ -48,15 +69,22 @@ def get_voice_names(api_url):
 
 
 def download_config():
-    resp = requests.get(
-        "https://huggingface.co/hexgrad/Kokoro-82M/raw/main/config.json"
+    resp = session.get(
+        "https://huggingface.co/hexgrad/Kokoro-82M/raw/main/config.json",
+        timeout=TIMEOUT,
     )
     resp.raise_for_status()
-    content = resp.content
-    with open(
-        Path(__file__).parent / "../src/kokoro_onnx/config.json", "wb", encoding="utf-8"
-    ) as fp:
-        fp.write(content)
+    # Binary mode takes no encoding, write the raw UTF-8 bytes as served
+    config_path = Path(__file__).parent / "../src/kokoro_onnx/config.json"
+    config_path.write_bytes(resp.content)
+
+
+def download_voice(url: str) -> np.ndarray:
+    r = session.get(url, timeout=TIMEOUT)
+    r.raise_for_status()  # Ensure the request was successful
+    content = io.BytesIO(r.content)
+    data: np.ndarray = torch.load(content, weights_only=True).numpy()
+    return data
 
 
 def download_voices(voice_url: str, names: list[str], npz_path: str):
@@ -64,22 +92,18 @@ def download_voices(voice_url: str, names: list[str], npz_path: str):
 
     # Extract voice files
     print(f"Found {count} voices")
-    voices = {}
-    for name in tqdm(names):
-        url = voice_url.format(name=name)
-        print(f"Downloading {name}")
-        r = requests.get(url)
-        r.raise_for_status()  # Ensure the request was successful
-        content = io.BytesIO(r.content)
-        data: np.ndarray = torch.load(content, weights_only=True).numpy()
-        voices[name] = data
+    urls = [voice_url.format(name=name) for name in names]
+    # Voices are small independent files, download them in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        data = list(tqdm(executor.map(download_voice, urls), total=count))
+    voices = dict(zip(names, data))
 
     # Save all voices to a single .npz file
-    with open(npz_path, "wb", encoding="utf-8") as f:
+    with open(npz_path, "wb") as f:
         np.savez(f, **voices)
 
-        mb_size = os.path.getsize(npz_path) // 1000 // 1000
-        print(f"Created {npz_path} ({mb_size}MB)")
+    mb_size = os.path.getsize(npz_path) // 1000 // 1000
+    print(f"Created {npz_path} ({mb_size}MB)")
 
 
 def main():
@@ -0,0 +1,68 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "onnx==1.17.0",
+#     "onnxruntime==1.20.1",
+# ]
+#
+# ///
+
+"""
+Dynamic INT8 quantization of kokoro.onnx for CPU inference.
+
+Only the linear/attention layers (MatMul, Gemm) are quantized, Conv and normalization layers stay in FP32.
+On CPUs with AVX512-VNNI / AVX-VNNI onnxruntime dispatches the INT8 kernels automatically.
+
+wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.onnx
+uv run scripts/quantize.py
+uv run scripts/quantize.py --input kokoro-v1.0.onnx --output kokoro-v1.0.int8.onnx
+"""
+
+import argparse
+import os
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+OP_TYPES_TO_QUANTIZE = ["MatMul", "Gemm"]
+
+
+def quantize(input_path: str, output_path: str, reduce_range: bool, per_channel: bool):
+    quantize_dynamic(
+        model_input=input_path,
+        model_output=output_path,
+        op_types_to_quantize=OP_TYPES_TO_QUANTIZE,
+        weight_type=QuantType.QInt8,
+        # 7-bit weights keep results correct on CPUs without VNNI (VPMADDUBSW saturation)
+        reduce_range=reduce_range,
+        per_channel=per_channel,
+    )
+    input_mb = os.path.getsize(input_path) // 1000 // 1000
+    output_mb = os.path.getsize(output_path) // 1000 // 1000
+    print(f"Created {output_path} ({input_mb}MB -> {output_mb}MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        "Quantize kokoro ONNX model to INT8", add_help=True
+    )
+    parser.add_argument(
+        "--input", "-i", type=str, default="kokoro-v1.0.onnx", help="fp32 model path"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="kokoro-v1.0.int8.onnx",
+        help="quantized model path",
+    )
+    parser.add_argument(
+        "--no_reduce_range",
+        help="use full 8-bit weights (only for hosts with VNNI)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--per_channel", help="quantize weights per channel", action="store_true"
+    )
+    args = parser.parse_args()
+
+    quantize(args.input, args.output, not args.no_reduce_range, args.per_channel)
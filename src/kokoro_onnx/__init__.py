@@ -1,7 +1,6 @@
 import asyncio
 import importlib
 import importlib.metadata
-import importlib.util
 import json
 import os
 import platform
@@ -13,7 +12,14 @@ import numpy as np
 import onnxruntime as rt
 from numpy.typing import NDArray
 
-from .config import MAX_PHONEME_LENGTH, SAMPLE_RATE, EspeakConfig, KoKoroConfig
+from .config import (
+    MAX_PHONEME_LENGTH,
+    PREFERRED_PROVIDERS,
+    SAMPLE_RATE,
+    STREAM_QUEUE_SIZE,
+    EspeakConfig,
+    KoKoroConfig,
+)
 from .log import log
 from .tokenizer import Tokenizer
 from .trim import trim as trim_audio
@@ -35,25 +41,36 @@ class Kokoro:
         self.config.validate()
 
         # See list of providers https://github.com/microsoft/onnxruntime/issues/22101#issuecomment-2357667377
-        providers = ["CPUExecutionProvider"]
-
-        # Check if kokoro-onnx installed with kokoro-onnx[gpu] feature (Windows/Linux)
-        gpu_enabled = importlib.util.find_spec("onnxruntime-gpu")
-        if gpu_enabled:
-            providers: list[str] = rt.get_available_providers()
+        # Accelerated providers are available when installed with kokoro-onnx[gpu] feature (Windows/Linux)
+        # or with OpenVINO / oneDNN builds of onnxruntime. CPU is kept last as fallback.
+        available_providers = rt.get_available_providers()
+        providers = [p for p in PREFERRED_PROVIDERS if p in available_providers]
 
         # Check if ONNX_PROVIDER environment variable was set
+        # Can be a comma separated fallback chain, e.g. CUDAExecutionProvider,CPUExecutionProvider
         env_provider = os.getenv("ONNX_PROVIDER")
         if env_provider:
-            providers = [env_provider]
+            providers = [p.strip() for p in env_provider.split(",") if p.strip()]
+
+        # See session options https://onnxruntime.ai/docs/performance/tune-performance/threading.html
+        sess_options = rt.SessionOptions()
+        # Check if ONNX_INTRA_OP_NUM_THREADS environment variable was set
+        env_threads = os.getenv("ONNX_INTRA_OP_NUM_THREADS")
+        if env_threads:
+            sess_options.intra_op_num_threads = int(env_threads)
 
         log.debug(f"Providers: {providers}")
-        self.sess = rt.InferenceSession(model_path, providers=providers)
-        self.voices: np.ndarray = np.load(voices_path)
+        self.sess = rt.InferenceSession(
+            model_path, sess_options=sess_options, providers=providers
+        )
+        self._input_names = {i.name for i in self.sess.get_inputs()}
+        self.voices = self._load_voices(voices_path)
 
         vocab = self._load_vocab(vocab_config)
         self.tokenizer = Tokenizer(espeak_config, vocab=vocab)
 
+        self._warmup()
+
     @classmethod
     def from_session(
         cls,
@@ -64,14 +81,54 @@ class Kokoro:
     ):
         instance = cls.__new__(cls)
         instance.sess = session
+        instance._input_names = {i.name for i in session.get_inputs()}
         instance.config = KoKoroConfig(session._model_path, voices_path, espeak_config)
         instance.config.validate()
-        instance.voices = np.load(voices_path)
+        instance.voices = instance._load_voices(voices_path)
 
         vocab = instance._load_vocab(vocab_config)
         instance.tokenizer = Tokenizer(espeak_config, vocab=vocab)
+
+        instance._warmup()
         return instance
 
+    def _warmup(self):
+        """
+        Run a short inference so onnxruntime selects its kernels before the first real request.
+        """
+        # Only when KOKORO_WARMUP=1 environment variable was set
+        if os.getenv("KOKORO_WARMUP") != "1":
+            return
+
+        start_t = time.time()
+        try:
+            voice = self.get_voice_style(self.get_voices()[0])
+            self._create_audio("a", voice, 1.0)
+        except Exception as e:
+            log.warning(f"Warmup failed: {e}")
+            return
+        log.debug(f"Warmup done in {time.time() - start_t:.2f}s")
+
+    def _load_voices(self, voices_path: str) -> dict[str, NDArray[np.float32]]:
+        """Load all voice styles into memory once.
+
+        Args:
+            voices_path: Path to voices file (npz archive).
+
+        Returns:
+            Dictionary of voice name to voice style array.
+        """
+
+        # NpzFile reads the array from the archive on every lookup, so decode it once
+        with np.load(voices_path) as voices:
+            styles = {name: voices[name] for name in voices.files}
+
+        # The same array is now returned by every get_voice_style() call,
+        # raise on in-place edits instead of silently changing the voice
+        for style in styles.values():
+            style.setflags(write=False)
+        return styles
+
     def _load_vocab(self, vocab_config: dict | str | None) -> dict:
         """Load vocabulary from config file or dictionary.
 
@@ -100,18 +157,19 @@ class Kokoro:
             )
         phonemes = phonemes[:MAX_PHONEME_LENGTH]
         start_t = time.time()
-        tokens = np.array(self.tokenizer.tokenize(phonemes), dtype=np.int64)
+        tokens = self.tokenizer.tokenize(phonemes)
         assert len(tokens) <= MAX_PHONEME_LENGTH, (
             f"Context length is {MAX_PHONEME_LENGTH}, but leave room for the pad token 0 at the start & end"
         )
 
         voice = voice[len(tokens)]
-        tokens = [[0, *tokens, 0]]
-        if "input_ids" in [i.name for i in self.sess.get_inputs()]:
+        # Build the padded int64 input once instead of letting onnxruntime convert nested lists
+        tokens = np.array([[0, *tokens, 0]], dtype=np.int64)
+        if "input_ids" in self._input_names:
             # Newer export versions
             inputs = {
                 "input_ids": tokens,
-                "style": np.array(voice, dtype=np.float32),
+                "style": voice,
                 "speed": np.array([speed], dtype=np.int32),
             }
         else:
@@ -130,6 +188,16 @@ class Kokoro:
         )
         return audio, SAMPLE_RATE
 
+    def _create_audio_part(
+        self, phonemes: str, voice: NDArray[np.float32], speed: float, trim: bool
+    ) -> tuple[NDArray[np.float32], int]:
+        audio, sample_rate = self._create_audio(phonemes, voice, speed)
+        if trim:
+            # Trim leading and trailing silence for a more natural sound concatenation
+            # (initial ~2s, subsequent ~0.02s)
+            audio, _ = trim_audio(audio)
+        return audio, sample_rate
+
     def get_voice_style(self, name: str) -> NDArray[np.float32]:
         return self.voices[name]
 
@@ -141,7 +209,9 @@ class Kokoro:
         # Regular expression to split by punctuation and keep them
         words = re.split(r"([.,!?;])", phonemes)
         batched_phoenemes: list[str] = []
-        current_batch = ""
+        # Collect the parts of the current batch and join them once
+        current_batch: list[str] = []
+        current_length = 0
 
         for part in words:
             # Remove leading/trailing whitespace
@@ -150,20 +220,23 @@ class Kokoro:
             if part:
                 # If adding the part exceeds the max length, split into a new batch
                 # TODO: make it more accurate
-                if len(current_batch) + len(part) + 1 >= MAX_PHONEME_LENGTH:
-                    batched_phoenemes.append(current_batch.strip())
-                    current_batch = part
+                if current_length + len(part) + 1 >= MAX_PHONEME_LENGTH:
+                    # Don't emit an empty batch when the first part alone is too long,
+                    # it would still cost a full inference for no audio
+                    if current_batch:
+                        batched_phoenemes.append("".join(current_batch).strip())
+                    current_batch = [part]
+                    current_length = len(part)
                 else:
-                    if part in ".,!?;":
-                        current_batch += part
-                    else:
-                        if current_batch:
-                            current_batch += " "
-                        current_batch += part
+                    if part not in ".,!?;" and current_batch:
+                        current_batch.append(" ")
+                        current_length += 1
+                    current_batch.append(part)
+                    current_length += len(part)
 
         # Append the last batch if it contains any phonemes
         if current_batch:
-            batched_phoenemes.append(current_batch.strip())
+            batched_phoenemes.append("".join(current_batch).strip())
 
         return batched_phoenemes
 
@@ -184,6 +257,8 @@ class Kokoro:
         if isinstance(voice, str):
             assert voice in self.voices, f"Voice {voice} not found in available voices"
             voice = self.get_voice_style(voice)
+        # Model runs in float32, cast once (e.g. blended voices may be float64)
+        voice = np.asarray(voice, dtype=np.float32)
 
         start_t = time.time()
         if is_phonemes:
@@ -198,13 +273,12 @@ class Kokoro:
             f"Creating audio for {len(batched_phoenemes)} batches for {len(phonemes)} phonemes"
         )
         for phonemes in batched_phoenemes:
-            audio_part, _ = self._create_audio(phonemes, voice, speed)
-            if trim:
-                # Trim leading and trailing silence for a more natural sound concatenation
-                # (initial ~2s, subsequent ~0.02s)
-                audio_part, _ = trim_audio(audio_part)
+            audio_part, _ = self._create_audio_part(phonemes, voice, speed, trim)
             audio.append(audio_part)
-        audio = np.concatenate(audio)
+        # Short texts fit in a single batch, no need to copy it into a new buffer.
+        # With trim this returns a view into the model output, so the trimmed-off
+        # silence of that one batch stays allocated for as long as the caller keeps it
+        audio = audio[0] if len(audio) == 1 else np.concatenate(audio)
         log.debug(f"Created audio in {time.time() - start_t:.2f}s")
         return audio, SAMPLE_RATE
 
@@ -225,39 +299,47 @@ class Kokoro:
         if isinstance(voice, str):
             assert voice in self.voices, f"Voice {voice} not found in available voices"
             voice = self.get_voice_style(voice)
+        # Model runs in float32, cast once (e.g. blended voices may be float64)
+        voice = np.asarray(voice, dtype=np.float32)
 
+        loop = asyncio.get_running_loop()
         if is_phonemes:
             phonemes = text
         else:
-            phonemes = self.tokenizer.phonemize(text, lang)
+            # Phonemize in separate thread so long texts don't block the event loop
+            phonemes = await loop.run_in_executor(
+                None, self.tokenizer.phonemize, text, lang
+            )
 
         batched_phonemes = self._split_phonemes(phonemes)
-        queue: asyncio.Queue[tuple[NDArray[np.float32], int] | None] = asyncio.Queue()
+        # Bound the queue so a slow consumer doesn't make finished chunks pile up in memory
+        queue: asyncio.Queue[tuple[NDArray[np.float32], int] | None] = asyncio.Queue(
+            maxsize=STREAM_QUEUE_SIZE
+        )
 
         async def process_batches():
             """Process phoneme batches in the background."""
             for i, phonemes in enumerate(batched_phonemes):
-                loop = asyncio.get_event_loop()
-                # Execute in separate thread since it's blocking operation
+                # Execute inference and trimming in separate thread since they're blocking operations
                 audio_part, sample_rate = await loop.run_in_executor(
-                    None, self._create_audio, phonemes, voice, speed
+                    None, self._create_audio_part, phonemes, voice, speed, trim
                 )
-                if trim:
-                    # Trim leading and trailing silence for a more natural sound concatenation
-                    # (initial ~2s, subsequent ~0.02s)
-                    audio_part, _ = trim_audio(audio_part)
                 log.debug(f"Processed chunk {i} of stream")
                 await queue.put((audio_part, sample_rate))
             await queue.put(None)  # Signal the end of the stream
 
         # Start processing in the background
-        asyncio.create_task(process_batches())
-
-        while True:
-            chunk = await queue.get()
-            if chunk is None:
-                break
-            yield chunk
+        task = asyncio.create_task(process_batches())
+
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            # Don't leave the producer blocked on a full queue if the consumer stops early
+            task.cancel()
 
     def get_voices(self) -> list[str]:
         return list(sorted(self.voices.keys()))
@@ -4,6 +4,18 @@ from pathlib import Path
 
 MAX_PHONEME_LENGTH = 510
 SAMPLE_RATE = 24000
+# Max audio chunks buffered ahead of the consumer in create_stream
+STREAM_QUEUE_SIZE = 4
+# Phonemes are cached for this many recent texts, only for texts up to the given length
+PHONEMIZE_CACHE_SIZE = 128
+PHONEMIZE_CACHE_MAX_TEXT_LENGTH = 1000
+# Execution providers used by default when available, in order of preference
+PREFERRED_PROVIDERS = [
+    "CUDAExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "DnnlExecutionProvider",
+    "CPUExecutionProvider",
+]
 
 
 @dataclass
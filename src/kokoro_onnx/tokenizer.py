@@ -1,15 +1,40 @@
 import ctypes
+import ctypes.util
+import functools
 import os
 import platform
 import sys
+import threading
 
 import espeakng_loader
 import phonemizer
 from phonemizer.backend.espeak.wrapper import EspeakWrapper
 
-from .config import DEFAULT_VOCAB, MAX_PHONEME_LENGTH, EspeakConfig
+from .config import (
+    DEFAULT_VOCAB,
+    MAX_PHONEME_LENGTH,
+    PHONEMIZE_CACHE_MAX_TEXT_LENGTH,
+    PHONEMIZE_CACHE_SIZE,
+    EspeakConfig,
+)
 from .log import log
 
+# espeak-ng keeps global state, phonemize may be called from executor threads
+_espeak_lock = threading.Lock()
+
+
+def _espeak_phonemize(text: str, lang: str) -> str:
+    with _espeak_lock:
+        return phonemizer.phonemize(
+            text, lang, preserve_punctuation=True, with_stress=True
+        )
+
+
+# Cache phonemes of recent short texts, the same text is often created again with only voice or speed changed
+_espeak_phonemize_cached = functools.lru_cache(maxsize=PHONEMIZE_CACHE_SIZE)(
+    _espeak_phonemize
+)
+
 
 class Tokenizer:
     def __init__(self, espeak_config: EspeakConfig | None = None, vocab: dict = None):
@@ -70,9 +95,10 @@ class Tokenizer:
         """
         if norm:
             text = Tokenizer.normalize_text(text)
-
-        phonemes = phonemizer.phonemize(
-            text, lang, preserve_punctuation=True, with_stress=True
-        )
+        # Long texts (articles, chapters) are rarely repeated and would keep a lot of memory alive
+        if len(text) <= PHONEMIZE_CACHE_MAX_TEXT_LENGTH:
+            phonemes = _espeak_phonemize_cached(text, lang)
+        else:
+            phonemes = _espeak_phonemize(text, lang)
         phonemes = "".join(filter(lambda p: p in self.vocab, phonemes))
         return phonemes.strip()
@@ -81,75 +81,6 @@ def abs2(x, dtype):
         return np.square(x, dtype=dtype)  # type: ignore
 
 
-def amplitude_to_db(
-    S,
-    *,
-    ref: float | Callable = 1.0,
-    amin: float = 1e-5,
-    top_db: float | None = 80.0,
-) -> np.floating[Any] | np.ndarray:
-    """Convert an amplitude spectrogram to dB-scaled spectrogram.
-
-    This is equivalent to ``power_to_db(S**2, ref=ref**2, amin=amin**2, top_db=top_db)``,
-    but is provided for convenience.
-
-    Parameters
-    ----------
-    S : np.ndarray
-        input amplitude
-
-    ref : scalar or callable
-        If scalar, the amplitude ``abs(S)`` is scaled relative to ``ref``:
-        ``20 * log10(S / ref)``.
-        Zeros in the output correspond to positions where ``S == ref``.
-
-        If callable, the reference value is computed as ``ref(S)``.
-
-    amin : float > 0 [scalar]
-        minimum threshold for ``S`` and ``ref``
-
-    top_db : float >= 0 [scalar]
-        threshold the output at ``top_db`` below the peak:
-        ``max(20 * log10(S/ref)) - top_db``
-
-    Returns
-    -------
-    S_db : np.ndarray
-        ``S`` measured in dB
-
-    See Also
-    --------
-    power_to_db, db_to_amplitude
-
-    Notes
-    -----
-    This function caches at level 30.
-    """
-    S = np.asarray(S)
-
-    if np.issubdtype(S.dtype, np.complexfloating):
-        warnings.warn(
-            "amplitude_to_db was called on complex input so phase "
-            "information will be discarded. To suppress this warning, "
-            "call amplitude_to_db(np.abs(S)) instead.",
-            stacklevel=2,
-        )
-
-    magnitude = np.abs(S)
-
-    if callable(ref):
-        # User supplied a function to calculate reference power
-        ref_value = ref(magnitude)
-    else:
-        ref_value = np.abs(ref)
-
-    out_array = magnitude if isinstance(magnitude, np.ndarray) else None
-    power = np.square(magnitude, out=out_array)
-
-    db: np.ndarray = power_to_db(power, ref=ref_value**2, amin=amin**2, top_db=top_db)
-    return db
-
-
 def _signal_to_frame_nonsilent(
     y: np.ndarray,
     frame_length: int = 2048,
@@ -193,11 +124,20 @@ def _signal_to_frame_nonsilent(
     non_silent : np.ndarray, shape=(m,), dtype=bool
         Indicator of non-silent frames
     """
-    # Compute the MSE for the signal
-    mse = rms(y=y, frame_length=frame_length, hop_length=hop_length)
+    # Compute the mean power for the signal
+    # (same as squaring rms(), without taking the square root and squaring it back)
+    power = _frame_power(y, frame_length=frame_length, hop_length=hop_length)[..., 0, :]
+
+    if ref is np.max:
+        # max(rms) ** 2 == max(power)
+        ref_value = np.max(power)
+    elif callable(ref):
+        ref_value = ref(np.sqrt(power)) ** 2
+    else:
+        ref_value = np.abs(ref) ** 2
 
-    # Convert to decibels and slice out the mse channel
-    db: np.ndarray = amplitude_to_db(mse[..., 0, :], ref=ref, top_db=None)
+    # Convert to decibels
+    db: np.ndarray = power_to_db(power, ref=ref_value, amin=1e-10, top_db=None)
 
     # Aggregate everything but the time dimension
     if db.ndim > 1:
@@ -371,15 +311,14 @@ def rms(
 
     """
     if y is not None:
-        if center:
-            padding = [(0, 0) for _ in range(y.ndim)]
-            padding[-1] = (int(frame_length // 2), int(frame_length // 2))
-            y = np.pad(y, padding, mode=pad_mode)
-
-        x = frame(y, frame_length=frame_length, hop_length=hop_length)
-
-        # Calculate power
-        power = np.mean(abs2(x, dtype=dtype), axis=-2, keepdims=True)
+        power = _frame_power(
+            y,
+            frame_length=frame_length,
+            hop_length=hop_length,
+            center=center,
+            pad_mode=pad_mode,
+            dtype=dtype,
+        )
     elif S is not None:
         # Check the frame length
         if S.shape[-2] != frame_length // 2 + 1:
@@ -406,6 +345,33 @@ def rms(
     return rms_result
 
 
+def _frame_power(
+    y: np.ndarray,
+    *,
+    frame_length: int = 2048,
+    hop_length: int = 512,
+    center: bool = True,
+    pad_mode="constant",
+    dtype=np.float32,
+) -> np.ndarray:
+    """Mean power of each frame of ``y``, shape=(..., 1, t).
+
+    This is the time-domain part of `rms` before taking the square root.
+    """
+    if center:
+        padding = [(0, 0) for _ in range(y.ndim)]
+        padding[-1] = (int(frame_length // 2), int(frame_length // 2))
+        y = np.pad(y, padding, mode=pad_mode)
+
+    # Square the signal once and frame that instead: overlapping frames would
+    # otherwise square every sample frame_length / hop_length times
+    x = frame(abs2(y, dtype=dtype), frame_length=frame_length, hop_length=hop_length)
+
+    # Calculate power
+    power: np.ndarray = np.mean(x, axis=-2, keepdims=True)
+    return power
+
+
 def frame(
     x: np.ndarray,
     *,
@@ -614,7 +580,6 @@ def power_to_db(
     --------
     perceptual_weighting
     db_to_power
-    amplitude_to_db
     db_to_amplitude
 
     Notes
@@ -688,13 +653,23 @@ def power_to_db(
     else:
         ref_value = np.abs(ref)
 
-    log_spec: np.ndarray = 10.0 * np.log10(np.maximum(amin, magnitude))
+    # Reuse the clipped copy for every step instead of allocating a temporary per operation
+    # Scalars have no buffer to reuse, keep them as scalars with numpy's usual promotion
+    in_place = magnitude.ndim > 0
+    if in_place:
+        log_spec: np.ndarray = np.maximum(amin, magnitude)
+        np.log10(log_spec, out=log_spec)
+        log_spec *= 10.0
+    else:
+        log_spec = 10.0 * np.log10(np.maximum(amin, magnitude))
     log_spec -= 10.0 * np.log10(np.maximum(amin, ref_value))
 
     if top_db is not None:
         if top_db < 0:
             raise ParameterError("top_db must be non-negative")
-        log_spec = np.maximum(log_spec, log_spec.max() - top_db)
+        log_spec = np.maximum(
+            log_spec, log_spec.max() - top_db, out=log_spec if in_place else None
+        )
 
     return log_spec
 